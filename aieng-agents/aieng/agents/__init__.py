@@ -1,19 +1,60 @@
-"""Utilities for AI Engineering Agents Bootcamp."""
+"""Utilities for AI Engineering Agents Bootcamp.
 
-from aieng.agents.agent_session import get_or_create_agent_session
-from aieng.agents.async_utils import (
-    gather_with_progress,
-    rate_limited,
-    register_async_cleanup,
-)
-from aieng.agents.client_manager import AsyncClientManager
-from aieng.agents.env_vars import Configs
-from aieng.agents.logging import set_up_logging
-from aieng.agents.pretty_printing import pretty_print
+Public names are loaded lazily (PEP 562), so importing a lightweight submodule
+such as ``aieng.agents.async_utils`` does not pull in the agents SDK, OpenAI or
+Weaviate clients until one of the names below is first accessed.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from aieng.agents.agent_session import get_or_create_agent_session
+    from aieng.agents.async_utils import (
+        AsyncRateLimiter,
+        gather_with_progress,
+        rate_limited,
+        register_async_cleanup,
+    )
+    from aieng.agents.client_manager import AsyncClientManager
+    from aieng.agents.env_vars import Configs
+    from aieng.agents.logging import set_up_logging
+    from aieng.agents.pretty_printing import pretty_print
+
+
+# Public name -> submodule of ``aieng.agents`` that defines it
+_LAZY_ATTRS = {
+    "AsyncClientManager": "client_manager",
+    "AsyncRateLimiter": "async_utils",
+    "Configs": "env_vars",
+    "gather_with_progress": "async_utils",
+    "get_or_create_agent_session": "agent_session",
+    "set_up_logging": "logging",
+    "pretty_print": "pretty_printing",
+    "rate_limited": "async_utils",
+    "register_async_cleanup": "async_utils",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """PEP 562: import the defining submodule on first access to a public name."""
+    submodule = _LAZY_ATTRS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f"{__name__}.{submodule}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
 
 
 __all__ = [
     "AsyncClientManager",
+    "AsyncRateLimiter",
     "Configs",
     "gather_with_progress",
     "get_or_create_agent_session",
@@ -2,6 +2,8 @@
 
 import asyncio
 import atexit
+import collections
+import time
 import types
 from typing import Any, Awaitable, Callable, Coroutine, Protocol, Sequence, TypeVar
 
@@ -84,6 +86,60 @@ async def rate_limited(
         return await _fn()
 
 
+class AsyncRateLimiter:
+    """Cap how many operations may start within a sliding time window.
+
+    Use as an async context manager around each call to a rate-limited API.
+    Waiting happens on the client side, so requests are paced to stay under
+    the provider's limit instead of being rejected with HTTP 429 and retried.
+
+    Parameters
+    ----------
+    max_rate : int
+        Maximum number of operations allowed to start per ``time_period``.
+    time_period : float, default 60.0
+        Length of the sliding window in seconds.
+
+    Examples
+    --------
+    >>> limiter = AsyncRateLimiter(500)  # 500 requests per minute
+    >>> async with limiter:
+    ...     await client.chat.completions.create(...)
+    """
+
+    def __init__(self, max_rate: int, time_period: float = 60.0) -> None:
+        if max_rate < 1:
+            raise ValueError("max_rate must be at least 1.")
+
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._timestamps: collections.deque[float] = collections.deque()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until another operation may start, then record it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                while (
+                    self._timestamps and now - self._timestamps[0] >= self.time_period
+                ):
+                    self._timestamps.popleft()
+
+                if len(self._timestamps) < self.max_rate:
+                    self._timestamps.append(now)
+                    return
+
+                await asyncio.sleep(self.time_period - (now - self._timestamps[0]))
+
+    async def __aenter__(self) -> None:
+        """Acquire a slot on entering the context."""
+        await self.acquire()
+
+    async def __aexit__(self, *_: object) -> None:
+        """Slots expire with the window, so there is nothing to release."""
+
+
 async def gather_with_progress(
     coros: "list[types.CoroutineType[Any, Any, T]]",
     description: str = "Running tasks",
@@ -126,4 +182,9 @@ async def gather_with_progress(
     return results  # type: ignore
 
 
-__all__ = ["gather_with_progress", "rate_limited", "register_async_cleanup"]
+__all__ = [
+    "AsyncRateLimiter",
+    "gather_with_progress",
+    "rate_limited",
+    "register_async_cleanup",
+]
@@ -104,6 +104,9 @@ class AsyncClientManager:
 
     async def close(self) -> None:
         """Close all initialized async clients."""
+        if self._knowledgebase is not None:
+            await self._knowledgebase.close()
+
         if self._weaviate_client is not None:
             await self._weaviate_client.close()
             self._weaviate_client = None
@@ -53,6 +53,18 @@ def __getattr__(name: str) -> Any:
         globals()[name] = value
         return value
 
+    if name == "get_cached_dataset_items":
+        mod = _import_langfuse_submodule("dataset_cache")
+        value = mod.get_cached_dataset_items
+        globals()[name] = value
+        return value
+
+    if name == "get_scored_item_ids":
+        mod = _import_langfuse_submodule("dataset_runs")
+        value = mod.get_scored_item_ids
+        globals()[name] = value
+        return value
+
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
@@ -62,6 +74,8 @@ def __dir__() -> list[str]:
 
 __all__ = [
     "flush_langfuse",
+    "get_cached_dataset_items",
+    "get_scored_item_ids",
     "langfuse_client",
     "set_up_langfuse_otlp_env_vars",
     "setup_langfuse_tracer",
@@ -0,0 +1,122 @@
+"""Local on-disk cache for Langfuse dataset items.
+
+Fetching a dataset with ``Langfuse.get_dataset`` walks every page of items over
+HTTP, which dominates start-up time for the evaluation scripts on larger
+datasets. This module keeps a pickled copy of the items under
+``~/.cache/agent-bootcamp/datasets`` and re-downloads them when items have been
+added or removed on the server, or when a refresh is requested.
+
+Existing items edited in place (e.g. re-uploading corrected answers under the
+same item IDs) are not detected, since that would require listing every item;
+pass ``refresh=True`` after such edits.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import urllib.parse
+from pathlib import Path
+from typing import Any
+
+from aieng.agents.langfuse.shared_client import _manager
+
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "agent-bootcamp" / "datasets"
+
+logger = logging.getLogger(__name__)
+
+
+def _dataset_fingerprint(client: Any, name: str) -> str:
+    """Return a short hash that changes when items are added or removed.
+
+    Combines the dataset's own ``updated_at`` with the total item count and the
+    first listed item, so adding or removing items invalidates the cache even
+    when the dataset record itself is untouched. In-place edits to other items
+    keep the same hash. Costs two small requests instead of one per page of
+    items.
+    """
+    dataset = client.api.datasets.get(dataset_name=urllib.parse.quote(name, safe=""))
+    first_page = client.api.dataset_items.list(dataset_name=name, page=1, limit=1)
+    latest = first_page.data[0] if first_page.data else None
+
+    parts = (
+        dataset.id,
+        dataset.updated_at.isoformat(),
+        str(first_page.meta.total_items),
+        latest.id if latest is not None else "",
+        latest.updated_at.isoformat() if latest is not None else "",
+    )
+    return hashlib.sha256("\x1f".join(parts).encode()).hexdigest()[:16]
+
+
+def _write_atomic(path: Path, payload: Any) -> None:
+    """Pickle ``payload`` to ``path`` without leaving partial files behind."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def get_cached_dataset_items(
+    name: str,
+    *,
+    client: Any | None = None,
+    cache_dir: Path | str | None = None,
+    refresh: bool = False,
+) -> list[Any]:
+    """Return the items of a Langfuse dataset, reusing a local copy if current.
+
+    Parameters
+    ----------
+    name : str
+        Name of the Langfuse dataset.
+    client : Langfuse, optional
+        Langfuse client to use. Defaults to the shared client.
+    cache_dir : Path or str, optional
+        Directory for cached item lists. Defaults to
+        ``~/.cache/agent-bootcamp/datasets``.
+    refresh : bool, default False
+        Ignore any cached copy and download the items again. Needed to pick up
+        in-place edits to existing items, which the cache does not detect.
+
+    Returns
+    -------
+    list
+        The same items as ``client.get_dataset(name).items``.
+    """
+    if client is None:
+        client = _manager.client
+
+    cache_dir = Path(cache_dir) if cache_dir is not None else DEFAULT_CACHE_DIR
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    prefix = urllib.parse.quote(name, safe="")
+    cache_path = cache_dir / f"{prefix}-{_dataset_fingerprint(client, name)}.pkl"
+
+    if cache_path.exists() and not refresh:
+        try:
+            with cache_path.open("rb") as f:
+                items = pickle.load(f)
+            logger.info(f"Loaded {len(items)} items of {name!r} from {cache_path}")
+            return items
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable dataset cache {cache_path}: {e}")
+
+    items = list(client.get_dataset(name).items)
+
+    # Drop copies keyed on older versions of this dataset.
+    for stale_path in cache_dir.glob(f"{prefix}-{'[0-9a-f]' * 16}.pkl"):
+        if stale_path != cache_path:
+            stale_path.unlink(missing_ok=True)
+
+    _write_atomic(cache_path, items)
+    return items
+
+
+__all__ = ["get_cached_dataset_items"]
@@ -0,0 +1,76 @@
+"""Inspect Langfuse dataset runs, e.g. to resume an interrupted evaluation."""
+
+from typing import Any
+
+from aieng.agents.langfuse.shared_client import _manager
+from langfuse.api import NotFoundError
+
+
+# Largest page size accepted by the Langfuse scores API
+_SCORES_PAGE_SIZE = 100
+
+
+def get_scored_item_ids(
+    dataset_name: str,
+    run_name: str,
+    score_name: str,
+    *,
+    client: Any | None = None,
+) -> set[str]:
+    """Return IDs of dataset items whose trace in a run already has a score.
+
+    A dataset run item is created as soon as an item starts running, so its
+    existence alone does not mean the item finished. Only items whose trace
+    carries a ``score_name`` score count as done; items that crashed before
+    being scored, or that were never scored, are left out.
+
+    Parameters
+    ----------
+    dataset_name : str
+        Name of the Langfuse dataset.
+    run_name : str
+        Name of the dataset run.
+    score_name : str
+        Name of the score that marks an item as done.
+    client : Langfuse, optional
+        Langfuse client to use. Defaults to the shared client.
+
+    Returns
+    -------
+    set[str]
+        IDs of the scored dataset items; empty if the run does not exist yet.
+    """
+    if client is None:
+        client = _manager.client
+
+    try:
+        dataset_run = client.get_dataset_run(
+            dataset_name=dataset_name, run_name=run_name
+        )
+    except NotFoundError:
+        return set()
+
+    # Scores are attached to traces, so collect every score with this name
+    # created since the run started and match them up by trace ID.
+    scored_trace_ids: set[str] = set()
+    page = 1
+    while True:
+        response = client.api.scores.get_many(
+            name=score_name,
+            from_timestamp=dataset_run.created_at,
+            page=page,
+            limit=_SCORES_PAGE_SIZE,
+        )
+        scored_trace_ids.update(_score.trace_id for _score in response.data)
+        if page >= response.meta.total_pages:
+            break
+        page += 1
+
+    return {
+        _run_item.dataset_item_id
+        for _run_item in dataset_run.dataset_run_items
+        if _run_item.trace_id in scored_trace_ids
+    }
+
+
+__all__ = ["get_scored_item_ids"]
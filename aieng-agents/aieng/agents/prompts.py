@@ -39,6 +39,19 @@ citation at the end should include relevant metadata from the search \
 results. Do NOT return raw search results.
 """
 
+KB_SEARCH_AGENT_INSTRUCTIONS = """\
+You are an agent specialized in searching a knowledge base.
+You will receive a single search query as input.
+Use the 'search_knowledgebase' tool to perform a search, then return a
+JSON object with:
+- 'summary': a concise synthesis of the retrieved information in your own words
+- 'sources': a list of citations with {type: "kb", title: "...", section: "..."}
+- 'no_results': true/false
+
+If the tool returns no matches, set "no_results": true and keep "sources" empty.
+Do NOT make up information. Do NOT return raw search results or long quotes.
+"""
+
 WIKI_SEARCH_PLANNER_INSTRUCTIONS = """\
 You are a research planner. \
 Given a user's query, produce a list of search terms that can be used to retrieve
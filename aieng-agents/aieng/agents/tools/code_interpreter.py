@@ -28,7 +28,11 @@ except ModuleNotFoundError as exc:
     )
 
 
-__all__ = ["CodeInterpreter", "CodeInterpreterOutput"]
+__all__ = ["CodeInterpreter", "CodeInterpreterOutput", "SetupCodeError"]
+
+
+class SetupCodeError(Exception):
+    """``setup_code`` raised an error in a new sandbox."""
 
 
 class _CodeInterpreterOutputError(BaseModel):
@@ -248,14 +252,24 @@ class CodeInterpreter:
     return_errors_as_json : bool, default=True
         When ``True``, transport and execution timeouts are returned as
         :class:`CodeInterpreterOutput` JSON with ``error.name`` in
-        ``{"ExecutionTimeout", "HttpTimeout", "StreamClosed", "RateLimitExceeded"}``
-        instead of raising.
+        ``{"ExecutionTimeout", "HttpTimeout", "StreamClosed", "RateLimitExceeded",
+        "SetupCodeFailed"}`` instead of raising.
         When ``False``, those errors propagate to the host (e.g. ADK tool failure).
+    reuse_sandbox : bool, default=False
+        Keep one sandbox alive across :meth:`run_code` calls so variables, imports
+        and files persist between them. Calls are serialized, and the sandbox
+        lifetime is extended by ``sandbox_timeout_seconds`` on each call. Call
+        :meth:`close` to shut it down.
+    setup_code : str | None, default=None
+        Python run once in each new sandbox after ``local_files`` are uploaded,
+        e.g. imports or opening data files. Most useful with ``reuse_sandbox``.
+        If it raises, the sandbox is killed and the call fails with
+        ``SetupCodeFailed`` instead of running the requested code.
 
     Notes
     -----
-    Each :meth:`run_code` creates a **new** sandbox; ``envs`` / ``metadata`` apply
-    only to that sandbox instance.
+    Unless ``reuse_sandbox`` is set, each :meth:`run_code` creates a **new**
+    sandbox; ``envs`` / ``metadata`` apply only to that sandbox instance.
     """
 
     def __init__(
@@ -273,6 +287,8 @@ class CodeInterpreter:
         sandbox_create_retry_base_seconds: float = 1.0,
         sandbox_create_retry_max_seconds: float = 30.0,
         return_errors_as_json: bool = True,
+        reuse_sandbox: bool = False,
+        setup_code: str | None = None,
     ) -> None:
         """Configure sandbox creation defaults used for every :meth:`run_code` call."""
         _validate_code_interpreter_init(
@@ -301,6 +317,11 @@ class CodeInterpreter:
         self.sandbox_create_retry_base_seconds = sandbox_create_retry_base_seconds
         self.sandbox_create_retry_max_seconds = sandbox_create_retry_max_seconds
         self.return_errors_as_json = return_errors_as_json
+        self.reuse_sandbox = reuse_sandbox
+        self.setup_code = setup_code
+
+        self._sandbox: AsyncSandbox | None = None
+        self._sandbox_lock = asyncio.Lock()
 
         self.local_files: list[Path] = []
         if local_files:
@@ -338,8 +359,64 @@ class CodeInterpreter:
         msg = "sandbox create retry loop exhausted without raising"
         raise AssertionError(msg)
 
+    async def _acquire_sandbox(self) -> AsyncSandbox:
+        """Return the shared sandbox if still alive, otherwise prepare a new one.
+
+        New sandboxes get ``local_files`` uploaded and ``setup_code`` run, and are
+        kept on the instance when ``reuse_sandbox`` is set.
+
+        Raises
+        ------
+        SetupCodeError
+            If ``setup_code`` raised; the new sandbox is killed, not kept.
+        """
+        if self._sandbox is not None:
+            try:
+                await self._sandbox.set_timeout(self.sandbox_timeout_seconds)
+                return self._sandbox
+            except Exception:
+                # Most likely the sandbox outlived its timeout while idle
+                await self._discard_sandbox(self._sandbox)
+
+        sbx = await self._create_sandbox()
+        try:
+            await _upload_files(sbx, self.local_files)
+            if self.setup_code is not None:
+                execution = await sbx.run_code(
+                    self.setup_code,
+                    on_error=lambda error: print(error.traceback),
+                    timeout=self._code_execution_timeout_seconds,
+                    request_timeout=self._request_timeout_seconds,
+                )
+                # A sandbox whose setup failed would only fail later calls with
+                # confusing errors (e.g. NameError), so never hand it out
+                if execution.error is not None:
+                    raise SetupCodeError(
+                        f"{execution.error.name}: {execution.error.value}"
+                    )
+        except BaseException:
+            await self._discard_sandbox(sbx)
+            raise
+
+        if self.reuse_sandbox:
+            self._sandbox = sbx
+        return sbx
+
+    async def _discard_sandbox(self, sbx: AsyncSandbox) -> None:
+        """Kill ``sbx``, forgetting it if it is the shared sandbox."""
+        if sbx is self._sandbox:
+            self._sandbox = None
+        with contextlib.suppress(Exception):
+            await sbx.kill()
+
+    async def close(self) -> None:
+        """Kill the sandbox kept alive by ``reuse_sandbox``, if any."""
+        async with self._sandbox_lock:
+            if self._sandbox is not None:
+                await self._discard_sandbox(self._sandbox)
+
     async def run_code(self, code: str) -> str:
-        """Execute Python code in a fresh sandbox and return output of execution.
+        """Execute Python code in a sandbox and return output of execution.
 
         Parameters
         ----------
@@ -375,29 +452,49 @@ class CodeInterpreter:
             attempts and ``self.return_errors_as_json`` is ``False``. Otherwise,
             returned as serialized JSON error output with
             ``error.name="RateLimitExceeded"``.
+        SetupCodeError
+            If ``setup_code`` raised in a new sandbox and
+            ``self.return_errors_as_json`` is ``False``. Otherwise, returned as
+            serialized JSON error output with ``error.name="SetupCodeFailed"``.
 
         Notes
         -----
-        Sandboxes are **not** reused: variables and downloaded files do not exist on the
-        next call.
+        Unless ``reuse_sandbox`` is set, sandboxes are **not** reused: variables and
+        downloaded files do not exist on the next call. A shared sandbox is replaced
+        after a timeout or dropped stream, since its kernel may still be busy.
         """
+        lock = self._sandbox_lock if self.reuse_sandbox else contextlib.nullcontext()
+        async with lock:
+            return await self._run_code(code)
+
+    def _acquire_failure_json(self, exc: RateLimitException | SetupCodeError) -> str:
+        """Describe why no sandbox could be prepared, as JSON error output."""
+        if isinstance(exc, SetupCodeError):
+            return _failure_json(
+                "SetupCodeFailed",
+                f"{exc} — the sandbox setup code failed, so the requested code "
+                "was not run. Fix the setup code or the files it uses.",
+            )
+        return _failure_json(
+            "RateLimitExceeded",
+            f"{exc} — E2B concurrent sandbox limit still exceeded after "
+            f"{self.sandbox_create_max_attempts} create attempt(s). "
+            "Retry the tool call after other sandboxes finish, or reduce "
+            "simultaneous code execution in the room.",
+        )
+
+    async def _run_code(self, code: str) -> str:
+        """Run ``code``; see :meth:`run_code`."""
         sbx: AsyncSandbox | None = None
+        keep_sandbox = False
         try:
             try:
-                sbx = await self._create_sandbox()
-            except RateLimitException as exc:
+                sbx = await self._acquire_sandbox()
+            except (RateLimitException, SetupCodeError) as exc:
                 if self.return_errors_as_json:
-                    return _failure_json(
-                        "RateLimitExceeded",
-                        f"{exc} — E2B concurrent sandbox limit still exceeded after "
-                        f"{self.sandbox_create_max_attempts} create attempt(s). "
-                        "Retry the tool call after other sandboxes finish, or reduce "
-                        "simultaneous code execution in the room.",
-                    )
+                    return self._acquire_failure_json(exc)
                 raise
 
-            await _upload_files(sbx, self.local_files)
-
             result = await sbx.run_code(
                 code,
                 on_error=lambda error: print(error.traceback),
@@ -411,6 +508,7 @@ class CodeInterpreter:
                 )
             if result.results:
                 response.results = serialize_results(result.results)
+            keep_sandbox = self.reuse_sandbox
             return response.model_dump_json()
         except TimeoutException as exc:
             if self.return_errors_as_json:
@@ -441,6 +539,5 @@ class CodeInterpreter:
                 )
             raise
         finally:
-            if sbx is not None:
-                with contextlib.suppress(Exception):
-                    await sbx.kill()
+            if sbx is not None and not keep_sandbox:
+                await self._discard_sandbox(sbx)
@@ -62,14 +62,12 @@ async def _fetch_current_events_html() -> str:
         "prop": "text",
         "format": "json",
     }
-    client = httpx.AsyncClient(
-        headers={
-            "User-Agent": (
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-                " (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36"
-            )
-        }
-    )
+    headers = {
+        "User-Agent": (
+            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+            " (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36"
+        )
+    }
 
     with Progress(
         SpinnerColumn(),
@@ -77,7 +75,8 @@ async def _fetch_current_events_html() -> str:
         TimeElapsedColumn(),
     ) as progress:
         progress.add_task("GET wikipedia/Portal:Current_events...")
-        resp = await client.get(api_url, params=params)
+        async with httpx.AsyncClient(headers=headers) as client:
+            resp = await client.get(api_url, params=params)
 
     resp.raise_for_status()
     data = resp.json()
@@ -146,7 +145,9 @@ async def get_news_events() -> CurrentEvents:
         dict mapping category of news events to list of news headlines.
     """
     html = await _fetch_current_events_html()
-    events_dict = _parse_current_events(html)
+    # Parsing the portal page is CPU-bound; keep it off the event loop so other
+    # agent turns are not stalled while it runs.
+    events_dict = await asyncio.to_thread(_parse_current_events, html)
 
     return CurrentEvents.model_validate(events_dict)
 
@@ -3,6 +3,7 @@
 import asyncio
 import logging
 import os
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
 import backoff
@@ -14,6 +15,7 @@ from aieng.agents.env_vars import Configs
 
 if TYPE_CHECKING:
     from weaviate.client import WeaviateAsyncClient
+    from weaviate.collections import CollectionAsync
 
 __all__ = ["AsyncWeaviateKnowledgeBase", "get_weaviate_async_client"]
 
@@ -38,7 +40,7 @@ class _SearchResult(pydantic.BaseModel):
     highlight: _Highlight
 
     def __repr__(self) -> str:
-        return self.model_dump_json(indent=2)
+        return self.model_dump_json()
 
 
 SearchResults = list[_SearchResult]
@@ -57,6 +59,7 @@ class AsyncWeaviateKnowledgeBase:
         embedding_model_name: str = "@cf/baai/bge-m3",
         embedding_api_key: str | None = None,
         embedding_base_url: str | None = None,
+        search_cache_size: int = 256,
     ) -> None:
         self.async_client = async_client
         self.collection_name = collection_name
@@ -64,17 +67,25 @@ class AsyncWeaviateKnowledgeBase:
         self.snippet_length = snippet_length
         self.logger = logging.getLogger(__name__)
         self.semaphore = asyncio.Semaphore(max_concurrency)
+        self._connect_lock = asyncio.Lock()
+        self._collection: "CollectionAsync | None" = None
 
         self.embedding_model_name = embedding_model_name
         self.embedding_api_key = embedding_api_key
         self.embedding_base_url = embedding_base_url
 
-        self._embed_client = openai.OpenAI(
+        self._embed_client = openai.AsyncOpenAI(
             api_key=self.embedding_api_key or os.getenv("EMBEDDING_API_KEY"),
             base_url=self.embedding_base_url or os.getenv("EMBEDDING_BASE_URL"),
             max_retries=5,
         )
 
+        # LRU of normalized keyword -> results; agents often retry the same search,
+        # and a hit also skips embedding the query. Callers get deep copies, so
+        # changing a returned result never alters what later searches see.
+        self.search_cache_size = search_cache_size
+        self._search_cache: OrderedDict[str, SearchResults] = OrderedDict()
+
     @backoff.on_exception(backoff.expo, exception=asyncio.CancelledError)  # type: ignore
     async def search_knowledgebase(self, keyword: str) -> SearchResults:
         """Search knowledge base.
@@ -96,18 +107,26 @@ class AsyncWeaviateKnowledgeBase:
             If Weaviate is not ready to accept requests (HTTP 503).
 
         """
-        async with self.async_client:
-            if not await self.async_client.is_ready():
-                raise Exception("Weaviate is not ready to accept requests (HTTP 503).")
-
-            collection = self.async_client.collections.get(self.collection_name)
-            vector = self._vectorize(keyword)
-            response = await rate_limited(
-                lambda: collection.query.hybrid(
-                    keyword, vector=vector, limit=self.num_results
-                ),
-                semaphore=self.semaphore,
+        cache_key = " ".join(keyword.lower().split())
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            self._search_cache.move_to_end(cache_key)
+            self.logger.info(
+                f"Query: {keyword}; Returned cached matches: {len(cached)}"
             )
+            return [_result.model_copy(deep=True) for _result in cached]
+
+        await self._ensure_connected()
+        if self._collection is None:
+            self._collection = self.async_client.collections.get(self.collection_name)
+        collection = self._collection
+        vector = await self._vectorize(keyword)
+        response = await rate_limited(
+            lambda: collection.query.hybrid(
+                keyword, vector=vector, limit=self.num_results
+            ),
+            semaphore=self.semaphore,
+        )
 
         self.logger.info(f"Query: {keyword}; Returned matches: {len(response.objects)}")
 
@@ -124,9 +143,41 @@ class AsyncWeaviateKnowledgeBase:
             }
             hits.append(hit)
 
-        return [_SearchResult.model_validate(_hit) for _hit in hits]
+        results = [_SearchResult.model_validate(_hit) for _hit in hits]
+
+        if self.search_cache_size > 0:
+            self._search_cache[cache_key] = [
+                _result.model_copy(deep=True) for _result in results
+            ]
+            if len(self._search_cache) > self.search_cache_size:
+                self._search_cache.popitem(last=False)
+
+        return results
+
+    async def _ensure_connected(self) -> None:
+        """Connect the Weaviate client on first use and keep it open.
+
+        The connection is shared by all searches and closed by the client's owner,
+        so each search skips the HTTP and gRPC handshakes.
+
+        Raises
+        ------
+        Exception
+            If Weaviate is not ready to accept requests (HTTP 503).
+        """
+        if self.async_client.is_connected():
+            return
 
-    def _vectorize(self, text: str) -> list[float]:
+        async with self._connect_lock:
+            if self.async_client.is_connected():
+                return
+            await self.async_client.connect()
+            if not await self.async_client.is_ready():
+                # Disconnect so that the next search checks readiness again
+                await self.async_client.close()
+                raise Exception("Weaviate is not ready to accept requests (HTTP 503).")
+
+    async def _vectorize(self, text: str) -> list[float]:
         """Vectorize text using the embedding client.
 
         Parameters
@@ -139,11 +190,19 @@ class AsyncWeaviateKnowledgeBase:
         list[float]
             A list of floats representing the vectorized text.
         """
-        response = self._embed_client.embeddings.create(
+        response = await self._embed_client.embeddings.create(
             input=text, model=self.embedding_model_name
         )
         return response.data[0].embedding
 
+    def clear_cache(self) -> None:
+        """Drop cached search results, e.g. after re-indexing."""
+        self._search_cache.clear()
+
+    async def close(self) -> None:
+        """Close the embedding client. The Weaviate client is owned by the caller."""
+        await self._embed_client.close()
+
 
 def get_weaviate_async_client(configs: Configs) -> "WeaviateAsyncClient":
     """Get an async Weaviate client.
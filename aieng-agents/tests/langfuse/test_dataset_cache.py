@@ -0,0 +1,92 @@
+"""Test local caching of Langfuse dataset items."""
+
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+
+from aieng.agents.langfuse.dataset_cache import get_cached_dataset_items
+
+
+UPDATED_AT = datetime(2025, 7, 16, tzinfo=timezone.utc)
+
+
+def _make_client(items: list[dict[str, Any]]) -> MagicMock:
+    """Build a stand-in Langfuse client serving ``items`` for any dataset."""
+    client = MagicMock()
+    client.api.datasets.get.return_value = SimpleNamespace(
+        id="dataset-id", updated_at=UPDATED_AT
+    )
+
+    def _list_items(**_: Any) -> SimpleNamespace:
+        latest = [SimpleNamespace(id=items[-1]["id"], updated_at=UPDATED_AT)]
+        return SimpleNamespace(
+            data=latest if items else [],
+            meta=SimpleNamespace(total_items=len(items)),
+        )
+
+    client.api.dataset_items.list.side_effect = _list_items
+    client.get_dataset.side_effect = lambda _name: SimpleNamespace(items=list(items))
+    return client
+
+
+def test_cache_hit_skips_full_fetch(tmp_path: Path) -> None:
+    """Second lookup of an unchanged dataset is served from disk."""
+    items = [{"id": "a"}, {"id": "b"}]
+    client = _make_client(items)
+
+    first = get_cached_dataset_items("news", client=client, cache_dir=tmp_path)
+    second = get_cached_dataset_items("news", client=client, cache_dir=tmp_path)
+
+    assert first == second == items
+    assert client.get_dataset.call_count == 1
+    assert len(list(tmp_path.glob("*.pkl"))) == 1
+
+
+def test_dataset_change_invalidates_cache(tmp_path: Path) -> None:
+    """Adding an item re-downloads the dataset and drops the stale copy."""
+    items = [{"id": "a"}]
+    client = _make_client(items)
+    get_cached_dataset_items("news", client=client, cache_dir=tmp_path)
+
+    items.append({"id": "b"})
+    refreshed = get_cached_dataset_items("news", client=client, cache_dir=tmp_path)
+
+    assert refreshed == [{"id": "a"}, {"id": "b"}]
+    assert client.get_dataset.call_count == 2
+    assert len(list(tmp_path.glob("*.pkl"))) == 1
+
+
+def test_corrupt_cache_is_refetched(tmp_path: Path) -> None:
+    """An unreadable cache file falls back to a fresh download."""
+    items = [{"id": "a"}]
+    client = _make_client(items)
+    get_cached_dataset_items("news", client=client, cache_dir=tmp_path)
+
+    (cache_path,) = tmp_path.glob("*.pkl")
+    cache_path.write_bytes(b"not a pickle")
+
+    assert get_cached_dataset_items("news", client=client, cache_dir=tmp_path) == items
+    assert client.get_dataset.call_count == 2
+
+
+def test_in_place_edit_requires_refresh(tmp_path: Path) -> None:
+    """Editing an item without changing the count is only seen on refresh."""
+    items = [{"id": "a", "answer": "old"}]
+    client = _make_client(items)
+    get_cached_dataset_items("news", client=client, cache_dir=tmp_path)
+
+    items[0] = {"id": "a", "answer": "new"}
+    stale = get_cached_dataset_items("news", client=client, cache_dir=tmp_path)
+    refreshed = get_cached_dataset_items(
+        "news", client=client, cache_dir=tmp_path, refresh=True
+    )
+
+    assert stale == [{"id": "a", "answer": "old"}]
+    assert refreshed == [{"id": "a", "answer": "new"}]
+    # The refreshed copy replaces the stale one for later lookups
+    assert get_cached_dataset_items("news", client=client, cache_dir=tmp_path) == [
+        {"id": "a", "answer": "new"}
+    ]
+    assert len(list(tmp_path.glob("*.pkl"))) == 1
@@ -0,0 +1,57 @@
+"""Test detection of already-scored items in a Langfuse dataset run."""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+
+from aieng.agents.langfuse.dataset_runs import get_scored_item_ids
+from langfuse.api import NotFoundError
+
+
+def _make_client(scored_trace_pages: list[list[str]]) -> MagicMock:
+    """Build a client whose run has items a, b and c on traces ta, tb and tc."""
+    client = MagicMock()
+    client.get_dataset_run.return_value = SimpleNamespace(
+        created_at=datetime(2025, 7, 16, tzinfo=timezone.utc),
+        dataset_run_items=[
+            SimpleNamespace(dataset_item_id=item_id, trace_id=f"t{item_id}")
+            for item_id in ("a", "b", "c")
+        ],
+    )
+
+    def _get_many(*, page: int, **_: Any) -> SimpleNamespace:
+        return SimpleNamespace(
+            data=[
+                SimpleNamespace(trace_id=trace_id)
+                for trace_id in scored_trace_pages[page - 1]
+            ],
+            meta=SimpleNamespace(total_pages=len(scored_trace_pages)),
+        )
+
+    client.api.scores.get_many.side_effect = _get_many
+    return client
+
+
+def test_only_scored_items_are_done() -> None:
+    """Run items without a score, e.g. from a crashed run, are not done."""
+    # Scores on other runs' traces (tz) are ignored.
+    client = _make_client([["ta", "tz"], ["tc"]])
+
+    done = get_scored_item_ids("news", "run-1", "is_answer_correct", client=client)
+
+    assert done == {"a", "c"}
+    assert client.api.scores.get_many.call_count == 2
+    assert client.api.scores.get_many.call_args.kwargs["name"] == "is_answer_correct"
+
+
+def test_missing_run_has_nothing_done() -> None:
+    """A run that does not exist yet has no completed items."""
+    client = MagicMock()
+    client.get_dataset_run.side_effect = NotFoundError(body="not found")
+
+    assert (
+        get_scored_item_ids("news", "new-run", "is_answer_correct", client=client)
+        == set()
+    )
+    client.api.scores.get_many.assert_not_called()
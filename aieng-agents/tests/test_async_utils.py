@@ -0,0 +1,33 @@
+"""Test async utilities."""
+
+import asyncio
+import time
+
+import pytest
+from aieng.agents import AsyncRateLimiter
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_paces_requests() -> None:
+    """Requests beyond max_rate wait for the window to slide."""
+    limiter = AsyncRateLimiter(max_rate=2, time_period=0.2)
+    start_times: list[float] = []
+
+    async def _request() -> None:
+        async with limiter:
+            start_times.append(time.monotonic())
+
+    start = time.monotonic()
+    await asyncio.gather(*(_request() for _ in range(5)))
+
+    # Two requests per window: 0, 0, 0.2, 0.2, 0.4
+    assert len(start_times) == 5
+    assert start_times[-1] - start >= 0.4
+    for i in range(2, 5):
+        assert start_times[i] - start_times[i - 2] >= 0.2 - 1e-3
+
+
+def test_rate_limiter_rejects_zero_rate() -> None:
+    """A limiter that can never admit a request is a configuration error."""
+    with pytest.raises(ValueError):
+        AsyncRateLimiter(max_rate=0)
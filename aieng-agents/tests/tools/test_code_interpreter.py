@@ -1,12 +1,17 @@
 """Test code interpreter tool."""
 
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from aieng.agents import pretty_print
-from aieng.agents.tools.code_interpreter import CodeInterpreter, CodeInterpreterOutput
+from aieng.agents.tools.code_interpreter import (
+    CodeInterpreter,
+    CodeInterpreterOutput,
+    SetupCodeError,
+)
 from e2b.exceptions import RateLimitException
 
 
@@ -92,6 +97,9 @@ class _FakeSandbox:
     async def kill(self) -> None:
         return None
 
+    async def set_timeout(self, timeout: int) -> None:
+        return None
+
     class Files:
         @staticmethod
         async def write(path: str, file: Any) -> None:
@@ -153,3 +161,85 @@ async def test_create_sandbox_rate_limit_exhausted(
         else:
             with pytest.raises(RateLimitException, match="429"):
                 await session.run_code("print(1)")
+
+
+@pytest.mark.asyncio
+async def test_reuse_sandbox_across_calls() -> None:
+    """With reuse_sandbox, setup runs once and one sandbox serves every call."""
+    sandbox = _FakeSandbox()
+    executed: list[str] = []
+    killed = {"count": 0}
+
+    async def fake_run_code(code: str, **kwargs: Any) -> _FakeRunResult:
+        executed.append(code)
+        return _FakeRunResult()
+
+    async def fake_kill() -> None:
+        killed["count"] += 1
+
+    sandbox.run_code = fake_run_code  # type: ignore[method-assign]
+    sandbox.kill = fake_kill  # type: ignore[method-assign]
+    create = AsyncMock(return_value=sandbox)
+
+    with patch("aieng.agents.tools.code_interpreter.AsyncSandbox.create", new=create):
+        session = CodeInterpreter(
+            sandbox_timeout_seconds=15,
+            reuse_sandbox=True,
+            setup_code="import pandas as pd",
+        )
+        await session.run_code("x = 1")
+        response = await session.run_code("print(x)")
+        assert killed["count"] == 0
+
+        await session.close()
+
+    assert create.await_count == 1
+    assert executed == ["import pandas as pd", "x = 1", "print(x)"]
+    assert killed["count"] == 1
+    assert CodeInterpreterOutput.model_validate_json(response).stdout == ["1"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("return_errors_as_json", [True, False])
+async def test_failed_setup_code_discards_sandbox(return_errors_as_json: bool) -> None:
+    """A sandbox whose setup code raised is killed and never reused."""
+    sandbox = _FakeSandbox()
+    executed: list[str] = []
+    killed = {"count": 0}
+
+    class _FailedSetupResult(_FakeRunResult):
+        error = SimpleNamespace(name="ModuleNotFoundError", value="No module 'foo'")
+
+    async def fake_run_code(code: str, **kwargs: Any) -> _FakeRunResult:
+        executed.append(code)
+        return _FailedSetupResult()
+
+    async def fake_kill() -> None:
+        killed["count"] += 1
+
+    sandbox.run_code = fake_run_code  # type: ignore[method-assign]
+    sandbox.kill = fake_kill  # type: ignore[method-assign]
+    create = AsyncMock(return_value=sandbox)
+
+    with patch("aieng.agents.tools.code_interpreter.AsyncSandbox.create", new=create):
+        session = CodeInterpreter(
+            sandbox_timeout_seconds=15,
+            return_errors_as_json=return_errors_as_json,
+            reuse_sandbox=True,
+            setup_code="import foo",
+        )
+        for _ in range(2):
+            if return_errors_as_json:
+                response = await session.run_code("print(1)")
+                error = CodeInterpreterOutput.model_validate_json(response).error
+                assert error is not None
+                assert error.name == "SetupCodeFailed"
+                assert "ModuleNotFoundError" in error.value
+            else:
+                with pytest.raises(SetupCodeError, match="ModuleNotFoundError"):
+                    await session.run_code("print(1)")
+
+    assert create.await_count == 2
+    assert executed == ["import foo", "import foo"]
+    assert killed["count"] == 2
+    assert session._sandbox is None
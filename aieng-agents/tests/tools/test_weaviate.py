@@ -1,6 +1,9 @@
 """Test cases for Weaviate integration."""
 
+import asyncio
+from types import SimpleNamespace
 from typing import Any, AsyncGenerator
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 import pytest_asyncio
@@ -39,3 +42,113 @@ async def test_weaviate_kb(weaviate_kb: AsyncWeaviateKnowledgeBase) -> None:
     responses = await weaviate_kb.search_knowledgebase("What is Toronto known for?")
     assert len(responses) > 0
     pretty_print(responses)
+
+
+@pytest.fixture()
+def mock_async_client() -> MagicMock:
+    """Weaviate client mock that tracks whether it is connected."""
+    state = {"connected": False}
+
+    async def connect() -> None:
+        state["connected"] = True
+
+    async def close() -> None:
+        state["connected"] = False
+
+    async_client = MagicMock()
+    async_client.is_connected.side_effect = lambda: state["connected"]
+    async_client.connect = AsyncMock(side_effect=connect)
+    async_client.close = AsyncMock(side_effect=close)
+    async_client.is_ready = AsyncMock(return_value=True)
+    async_client.collections.get.return_value.query.hybrid = AsyncMock(
+        return_value=SimpleNamespace(objects=[])
+    )
+    return async_client
+
+
+@pytest.fixture()
+def mock_kb(mock_async_client: MagicMock) -> AsyncWeaviateKnowledgeBase:
+    """Knowledgebase on the mocked client, with query embedding stubbed out."""
+    kb = AsyncWeaviateKnowledgeBase(
+        async_client=mock_async_client,
+        collection_name="test",
+        embedding_api_key="test",
+        embedding_base_url="http://localhost",
+    )
+    kb._vectorize = AsyncMock(return_value=[0.0])  # type: ignore[method-assign]
+    return kb
+
+
+@pytest.mark.asyncio
+async def test_search_reuses_cached_results(
+    mock_async_client: MagicMock, mock_kb: AsyncWeaviateKnowledgeBase
+) -> None:
+    """Searches differing only in case and whitespace hit Weaviate once."""
+    hybrid = mock_async_client.collections.get.return_value.query.hybrid
+    hybrid.return_value = SimpleNamespace(
+        objects=[SimpleNamespace(properties={"title": "Toronto", "text": "City"})]
+    )
+
+    first = await mock_kb.search_knowledgebase("What is Toronto known for?")
+    second = await mock_kb.search_knowledgebase("  what is toronto   known for? ")
+
+    assert first == second
+    assert first[0].source.title == "Toronto"
+    assert hybrid.await_count == 1
+
+    mock_kb.clear_cache()
+    await mock_kb.search_knowledgebase("What is Toronto known for?")
+    assert hybrid.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_results_are_not_shared(
+    mock_async_client: MagicMock, mock_kb: AsyncWeaviateKnowledgeBase
+) -> None:
+    """Changing a returned result does not alter later cache hits."""
+    hybrid = mock_async_client.collections.get.return_value.query.hybrid
+    hybrid.return_value = SimpleNamespace(
+        objects=[SimpleNamespace(properties={"title": "Toronto", "text": "City"})]
+    )
+
+    first = await mock_kb.search_knowledgebase("Toronto")
+    first[0].source.title = "Changed"
+    first[0].highlight.text.append("extra")
+    second = await mock_kb.search_knowledgebase("Toronto")
+    second[0].highlight.text.clear()
+    third = await mock_kb.search_knowledgebase("Toronto")
+
+    assert hybrid.await_count == 1
+    assert third[0].source.title == "Toronto"
+    assert third[0].highlight.text == ["City"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_searches_connect_once(
+    mock_async_client: MagicMock, mock_kb: AsyncWeaviateKnowledgeBase
+) -> None:
+    """Concurrent searches share one connection that stays open afterwards."""
+    await asyncio.gather(
+        mock_kb.search_knowledgebase("Toronto"),
+        mock_kb.search_knowledgebase("Montreal"),
+    )
+    await mock_kb.search_knowledgebase("Vancouver")
+
+    assert mock_async_client.connect.await_count == 1
+    mock_async_client.close.assert_not_called()
+    mock_async_client.collections.get.assert_called_once_with("test")
+
+
+@pytest.mark.asyncio
+async def test_not_ready_client_is_rechecked(
+    mock_async_client: MagicMock, mock_kb: AsyncWeaviateKnowledgeBase
+) -> None:
+    """A client that is not ready is disconnected, so the next search retries."""
+    mock_async_client.is_ready.side_effect = [False, True]
+
+    with pytest.raises(Exception, match="not ready"):
+        await mock_kb.search_knowledgebase("Toronto")
+    assert not mock_async_client.is_connected()
+
+    assert await mock_kb.search_knowledgebase("Toronto") == []
+    assert mock_async_client.is_ready.await_count == 2
@@ -69,9 +69,11 @@ async def _main(
 
     async for _item in result_stream.stream_events():
         # Parse the stream events, convert to Gradio chat messages and append to
-        # the chat history
-        turn_messages += oai_agent_stream_to_gradio_messages(_item)
-        if len(turn_messages) > 0:
+        # the chat history. Most events (e.g. token deltas) add no messages; only
+        # re-send the history to the UI when something new arrived.
+        new_messages = oai_agent_stream_to_gradio_messages(_item)
+        if new_messages:
+            turn_messages += new_messages
             yield turn_messages
 
 
@@ -3,13 +3,13 @@
 Log traces to LangFuse for observability and evaluation.
 """
 
+import logging
 from typing import Any, AsyncGenerator
 
 import agents
 import gradio as gr
 from aieng.agents import (
     get_or_create_agent_session,
-    pretty_print,
     register_async_cleanup,
     set_up_logging,
 )
@@ -27,6 +27,7 @@ load_dotenv(verbose=True)
 
 # Set logging level and suppress some noisy logs from dependencies
 set_up_logging()
+logger = logging.getLogger(__name__)
 
 if gr.NO_RELOAD:
     # Set up LangFuse for tracing
@@ -83,13 +84,15 @@ async def _main(
         )
 
         async for _item in result_stream.stream_events():
-            turn_messages += oai_agent_stream_to_gradio_messages(_item)
-            if len(turn_messages) > 0:
+            # Only re-send the history when the event added messages
+            new_messages = oai_agent_stream_to_gradio_messages(_item)
+            if new_messages:
+                turn_messages += new_messages
                 yield turn_messages
 
         obs.update(output=result_stream.final_output)
 
-    pretty_print(turn_messages)
+    logger.debug("Turn messages: %s", turn_messages)
     yield turn_messages
 
 
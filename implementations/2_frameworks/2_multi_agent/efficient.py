@@ -6,6 +6,7 @@ github.com/ComplexData-MILA/misinfo-datasets
 /blob/3304e6e/misinfo_data_eval/tasks/web_search.py
 """
 
+import functools
 from typing import Any, AsyncGenerator
 
 import agents
@@ -44,6 +45,7 @@ if gr.NO_RELOAD:
     register_async_cleanup(client_manager)
 
 
+@functools.cache
 def _get_main_agent() -> agents.Agent:
     # Worker Agent: handles long context efficiently
     search_agent = agents.Agent(
@@ -114,8 +116,10 @@ async def _main(
         )
 
         async for _item in result_stream.stream_events():
-            turn_messages += oai_agent_stream_to_gradio_messages(_item)
-            if len(turn_messages) > 0:
+            # Only re-send the history when the event added messages
+            new_messages = oai_agent_stream_to_gradio_messages(_item)
+            if new_messages:
+                turn_messages += new_messages
                 yield turn_messages
 
         obs.update(output=result_stream.final_output)
@@ -1,5 +1,6 @@
 """Example code for planner-worker agent collaboration with multiple tools."""
 
+import functools
 from typing import Any, AsyncGenerator
 
 import agents
@@ -13,7 +14,10 @@ from aieng.agents.client_manager import AsyncClientManager
 from aieng.agents.gradio import get_common_gradio_config
 from aieng.agents.gradio.messages import oai_agent_stream_to_gradio_messages
 from aieng.agents.langfuse import langfuse_client, setup_langfuse_tracer
-from aieng.agents.prompts import WIKI_AND_WEB_ORCHESTRATOR_INSTRUCTIONS
+from aieng.agents.prompts import (
+    KB_SEARCH_AGENT_INSTRUCTIONS,
+    WIKI_AND_WEB_ORCHESTRATOR_INSTRUCTIONS,
+)
 from aieng.agents.tools.gemini_grounding import (
     GeminiGroundingWithGoogleSearch,
     ModelSettings,
@@ -42,6 +46,7 @@ if gr.NO_RELOAD:
     register_async_cleanup(client_manager)
 
 
+@functools.cache
 def _get_main_agent() -> agents.Agent:
     # Use smaller, faster model for focused search tasks
     worker_model = client_manager.configs.default_worker_model
@@ -55,18 +60,7 @@ def _get_main_agent() -> agents.Agent:
     # Worker Agent: handles long context efficiently
     kb_agent = agents.Agent(
         name="KnowledgeBaseAgent",
-        instructions="""
-            You are an agent specialized in searching a knowledge base.
-            You will receive a single search query as input.
-            Use the 'search_knowledgebase' tool to perform a search, then return a
-            JSON object with:
-            - 'summary': a concise synthesis of the retrieved information in your own words
-            - 'sources': a list of citations with {type: "kb", title: "...", section: "..."}
-            - 'no_results': true/false
-
-            If the tool returns no matches, set "no_results": true and keep "sources" empty.
-            Do NOT make up information. Do NOT return raw search results or long quotes.
-        """,
+        instructions=KB_SEARCH_AGENT_INSTRUCTIONS,
         tools=[
             agents.function_tool(client_manager.knowledgebase.search_knowledgebase),
         ],
@@ -138,8 +132,10 @@ async def _main(
         )
 
         async for _item in result_stream.stream_events():
-            turn_messages += oai_agent_stream_to_gradio_messages(_item)
-            if len(turn_messages) > 0:
+            # Only re-send the history when the event added messages
+            new_messages = oai_agent_stream_to_gradio_messages(_item)
+            if new_messages:
+                turn_messages += new_messages
                 yield turn_messages
 
         obs.update(output=result_stream.final_output)
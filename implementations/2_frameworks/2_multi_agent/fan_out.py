@@ -329,6 +329,49 @@ async def process_conflict_reviews(
     ]
 
 
+async def _main(documents: list[Document]) -> None:
+    """Run fan-out and review in a single event loop, then close the clients."""
+    try:
+        with langfuse_client.start_as_current_observation(
+            name="Fan-Out", as_type="chain", input=args.source_dataset
+        ) as span:
+            # Run O(N^2) agents on N documents to identify pairwise e.g., conflicts.
+            document_pairs = build_document_pairs(documents)  # type: ignore[arg-type]
+            print(
+                f"Built {len(document_pairs)} pair(s) from {len(documents)} document(s)."
+            )
+
+            with langfuse_client.start_as_current_observation(
+                name="Conflicts - Pairwise", as_type="chain"
+            ) as obs:
+                flagged_pairs = await process_fan_out(document_pairs)
+                obs.update(
+                    input=args.source_dataset,
+                    output=f"{len(flagged_pairs)} pairs identified.",
+                )
+
+            # Collect conflicts related to each document.
+            # from O(N^2) pairs to O(N) summarized per-document conflicts.
+            conflicted_documents = group_conflicts(flagged_pairs)
+
+            # Review these O(N) per-document conflicts.
+            with langfuse_client.start_as_current_observation(
+                name="Conflicts - Review", as_type="chain"
+            ) as obs:
+                conflict_reviews = await process_conflict_reviews(conflicted_documents)
+                obs.update(input=conflicted_documents, output=conflict_reviews)
+
+            # Generate markdown output
+            with open(args.output_report, "w") as output_file:
+                reports = [_review.get_report() for _review in conflict_reviews]
+                output_file.write("\n".join(reports))
+                print(f"Writing report to {args.output_report}.")
+
+            span.update(output="Wrote report to " + args.output_report)
+    finally:
+        await client_manager.close()
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--source_dataset", required=True)
@@ -392,43 +435,4 @@ if __name__ == "__main__":
     assert isinstance(dataset_dict, datasets.DatasetDict)
     documents = list(dataset_dict["train"])[: args.num_rows]
 
-    with langfuse_client.start_as_current_observation(
-        name="Fan-Out", as_type="chain", input=args.source_dataset
-    ) as span:
-        # Run O(N^2) agents on N documents to identify pairwise e.g., conflicts.
-        document_pairs = build_document_pairs(documents)  # type: ignore[arg-type]
-        print(f"Built {len(document_pairs)} pair(s) from {len(documents)} document(s).")
-
-        with langfuse_client.start_as_current_observation(
-            name="Conflicts - Pairwise", as_type="chain"
-        ) as obs:
-            flagged_pairs = asyncio.get_event_loop().run_until_complete(
-                process_fan_out(document_pairs)
-            )
-            obs.update(
-                input=args.source_dataset,
-                output=f"{len(flagged_pairs)} pairs identified.",
-            )
-
-        # Collect conflicts related to each document.
-        # from O(N^2) pairs to O(N) summarized per-document conflicts.
-        conflicted_documents = group_conflicts(flagged_pairs)
-
-        # Review these O(N) per-document conflicts.
-        with langfuse_client.start_as_current_observation(
-            name="Conflicts - Review", as_type="chain"
-        ) as obs:
-            conflict_reviews: list[ReviewedDocument] = (
-                asyncio.get_event_loop().run_until_complete(
-                    process_conflict_reviews(conflicted_documents)
-                )
-            )
-            obs.update(input=conflicted_documents, output=conflict_reviews)
-
-        # Generate markdown output
-        with open(args.output_report, "w") as output_file:
-            reports = [_review.get_report() for _review in conflict_reviews]
-            output_file.write("\n".join(reports))
-            print(f"Writing report to {args.output_report}.")
-
-        span.update(output="Wrote report to " + args.output_report)
+    asyncio.run(_main(documents))
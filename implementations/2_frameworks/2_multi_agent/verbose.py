@@ -7,16 +7,22 @@ the additional structures, and you are okay with the additional complexities.
 Log traces to LangFuse for observability and evaluation.
 """
 
+import asyncio
+import functools
+import hashlib
+import logging
+from collections import OrderedDict
 from typing import Any, AsyncGenerator
 
 import agents
 import gradio as gr
 from aieng.agents import (
     get_or_create_agent_session,
-    pretty_print,
+    rate_limited,
     register_async_cleanup,
     set_up_logging,
 )
+from aieng.agents.async_utils import indexed
 from aieng.agents.client_manager import AsyncClientManager
 from aieng.agents.gradio import get_common_gradio_config
 from aieng.agents.gradio.messages import oai_agent_items_to_gradio_messages
@@ -36,6 +42,7 @@ load_dotenv(verbose=True)
 
 # Set logging level and suppress some noisy logs from dependencies
 set_up_logging()
+logger = logging.getLogger(__name__)
 
 if gr.NO_RELOAD:
     # Set up LangFuse for tracing
@@ -50,6 +57,28 @@ if gr.NO_RELOAD:
     # Register async cleanup to ensure clients are properly closed on program exit
     register_async_cleanup(client_manager)
 
+# Maximum number of search steps researched at the same time
+MAX_CONCURRENT_SEARCHES = 5
+
+# Maximum number of agent runs in flight across all chat sessions, so that
+# several users fanning out searches at once queue up instead of tripping the
+# LLM provider's rate limits
+MAX_CONCURRENT_AGENT_RUNS = 8
+_agent_run_semaphore = asyncio.Semaphore(MAX_CONCURRENT_AGENT_RUNS)
+
+# Research results for recently seen search terms, reused across chat turns.
+# Keys include the agent's model and instructions, so editing either invalidates.
+# Only the summary and the items shown in the chat are kept, not the full run.
+RESEARCH_CACHE_SIZE = 256
+_research_cache: OrderedDict[str, tuple[str, list[agents.RunItem]]] = OrderedDict()
+
+# Search plans for opening questions, with the items the planner run added to
+# its session so a cache hit leaves the same conversation history behind.
+SEARCH_PLAN_CACHE_SIZE = 128
+_search_plan_cache: OrderedDict[
+    str, tuple["SearchPlan", list[agents.TResponseInputItem]]
+] = OrderedDict()
+
 
 class SearchItem(BaseModel):
     """A single search item in the search plan."""
@@ -84,6 +113,8 @@ class ResearchReport(BaseModel):
     full_report: str
 
 
+# The agents are stateless across chat turns, so build them once per process
+@functools.cache
 def _get_agents() -> tuple[agents.Agent, agents.Agent, agents.Agent]:
     # Use smaller, faster model for focused search tasks
     worker_model = client_manager.configs.default_worker_model
@@ -125,12 +156,96 @@ def _get_agents() -> tuple[agents.Agent, agents.Agent, agents.Agent]:
     return planner_agent, research_agent, writer_agent
 
 
+def _run_cache_key(agent: agents.Agent, text: str) -> str:
+    """Identify an agent run by agent configuration and normalized input."""
+    model_name = getattr(agent.model, "model", agent.model)
+    parts = (
+        agent.name,
+        str(model_name),
+        str(agent.instructions),
+        " ".join(text.lower().split()),
+    )
+    return hashlib.sha256("\x00".join(parts).encode()).hexdigest()
+
+
+def clear_caches() -> None:
+    """Drop cached search plans and research results, e.g. after reindexing."""
+    _search_plan_cache.clear()
+    _research_cache.clear()
+
+
+def _dedupe_search_steps(search_plan: SearchPlan) -> SearchPlan:
+    """Drop steps whose search term repeats an earlier one, ignoring case."""
+    seen: set[str] = set()
+    unique_steps: list[SearchItem] = []
+    for step in search_plan.search_steps:
+        normalized_term = " ".join(step.search_term.lower().split())
+        if normalized_term not in seen:
+            seen.add(normalized_term)
+            unique_steps.append(step)
+    return SearchPlan(search_steps=unique_steps)
+
+
 async def _create_search_plan(
     planner_agent: agents.Agent, query: str, session: agents.Session | None = None
 ) -> SearchPlan:
-    """Create a search plan using the planner agent."""
-    response = await agents.Runner.run(planner_agent, input=query, session=session)
-    return response.final_output_as(SearchPlan)
+    """Create a search plan using the planner agent.
+
+    Plans for the first turn of a conversation depend only on the query, so they
+    are cached. Follow-up turns are always planned against the session history.
+    """
+    is_first_turn = session is None or not await session.get_items(limit=1)
+    cache_key = _run_cache_key(planner_agent, query)
+    if is_first_turn and cache_key in _search_plan_cache:
+        _search_plan_cache.move_to_end(cache_key)
+        search_plan, session_items = _search_plan_cache[cache_key]
+        if session is not None:
+            await session.add_items(session_items)
+        return search_plan
+
+    async with _agent_run_semaphore:
+        response = await agents.Runner.run(planner_agent, input=query, session=session)
+    # Repeated terms would be researched twice and summarized twice for the writer
+    search_plan = _dedupe_search_steps(response.final_output_as(SearchPlan))
+
+    if is_first_turn:
+        _search_plan_cache[cache_key] = (search_plan, response.to_input_list())
+        if len(_search_plan_cache) > SEARCH_PLAN_CACHE_SIZE:
+            _search_plan_cache.popitem(last=False)
+
+    return search_plan
+
+
+async def _run_research_step(
+    research_agent: agents.Agent, search_term: str
+) -> tuple[str, list[agents.RunItem]]:
+    """Research one search term, returning its summary and the run's new items.
+
+    Results are cached, so repeated search terms reuse an earlier run.
+    """
+    cache_key = _run_cache_key(research_agent, search_term)
+    cached = _research_cache.get(cache_key)
+    if cached is not None:
+        _research_cache.move_to_end(cache_key)
+        return cached
+
+    with langfuse_client.start_as_current_observation(
+        name="Researcher-Agent", as_type="chain", input=search_term
+    ) as researcher_obs:
+        async with _agent_run_semaphore:
+            response = await agents.Runner.run(
+                research_agent,
+                input=search_term,
+                max_turns=30,  # Allow more turns for complex searches
+            )
+        researcher_obs.update(output=response.final_output)
+
+    result = (str(response.final_output), response.new_items)
+    _research_cache[cache_key] = result
+    if len(_research_cache) > RESEARCH_CACHE_SIZE:
+        _research_cache.popitem(last=False)
+
+    return result
 
 
 async def _generate_final_report(
@@ -148,9 +263,10 @@ async def _generate_final_report(
     with langfuse_client.start_as_current_observation(
         name="Writer-Agent", as_type="chain", input=input_data
     ) as obs:
-        response = await agents.Runner.run(
-            writer_agent, input=input_data, session=session
-        )
+        async with _agent_run_semaphore:
+            response = await agents.Runner.run(
+                writer_agent, input=input_data, session=session
+            )
         obs.update(output=response.final_output)
         return response
 
@@ -207,31 +323,43 @@ async def _main(
                     },
                 )
             )
-        pretty_print(turn_messages)
+        logger.debug("Turn messages: %s", turn_messages)
         yield turn_messages
 
         # Execute the search plan
-        # NOTE: searches are done sequentially here for simplicity.
-        # TODO: As an exercise, try to paralleize the execution of the search steps.
-        search_results = []
-        for step in search_plan.search_steps:
-            with langfuse_client.start_as_current_observation(
-                name="Researcher-Agent", as_type="chain", input=step.search_term
-            ) as researcher_obs:
-                response = await agents.Runner.run(
-                    research_agent,
-                    input=step.search_term,
-                    session=session,
-                    max_turns=30,  # Allow more turns for complex searches
+        # The search steps are independent, so they are researched concurrently.
+        # NOTE: research runs do not use the chat session; concurrent runs would
+        # interleave their items in the shared conversation history.
+        # Results are shown as each step finishes, but kept in plan order.
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SEARCHES)
+        research_tasks = [
+            asyncio.create_task(
+                indexed(
+                    index,
+                    rate_limited(
+                        lambda _step=step: _run_research_step(
+                            research_agent, _step.search_term
+                        ),
+                        semaphore=semaphore,
+                    ),
                 )
-                search_result: str = response.final_output
-                researcher_obs.update(output=search_result)
-
-            search_results.append(search_result)
-            turn_messages += oai_agent_items_to_gradio_messages(
-                response.new_items, is_final_output=False
             )
-            yield turn_messages
+            for index, step in enumerate(search_plan.search_steps)
+        ]
+
+        search_results: list[str] = [""] * len(research_tasks)
+        try:
+            for finished in asyncio.as_completed(research_tasks):
+                index, (summary, new_items) = await finished
+                search_results[index] = summary
+                turn_messages += oai_agent_items_to_gradio_messages(
+                    new_items, is_final_output=False
+                )
+                yield turn_messages
+        finally:
+            # Stop outstanding searches if the user abandons the turn
+            for task in research_tasks:
+                task.cancel()
 
         # Generate the final report
         writer_agent_response = await _generate_final_report(
@@ -246,7 +374,7 @@ async def _main(
                 content=f"## Summary\n{report.summary}\n\n## Full Report\n{report.full_report}",
             )
         )
-        pretty_print(turn_messages)
+        logger.debug("Turn messages: %s", turn_messages)
         yield turn_messages
 
 
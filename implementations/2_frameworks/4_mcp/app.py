@@ -3,6 +3,7 @@
 Log traces to LangFuse for observability and evaluation.
 """
 
+import logging
 import subprocess
 from typing import Any, AsyncGenerator
 
@@ -11,7 +12,6 @@ import gradio as gr
 from agents.mcp import MCPServerStdio, create_static_tool_filter
 from aieng.agents import (
     get_or_create_agent_session,
-    pretty_print,
     register_async_cleanup,
     set_up_logging,
 )
@@ -28,6 +28,7 @@ load_dotenv(verbose=True)
 
 # Set logging level and suppress some noisy logs from dependencies
 set_up_logging()
+logger = logging.getLogger(__name__)
 
 if gr.NO_RELOAD:
     # Set up LangFuse for tracing
@@ -42,6 +43,17 @@ if gr.NO_RELOAD:
     # Register async cleanup to ensure clients are properly closed on program exit
     register_async_cleanup(client_manager)
 
+# Get the absolute path to the current git repository, regardless of where
+# the script is run from. It cannot change while the app is running, so it is
+# resolved once here rather than with a blocking subprocess call on every turn.
+REPO_PATH = subprocess.check_output(
+    ["git", "rev-parse", "--show-toplevel"], text=True
+).strip()
+
+GIT_AGENT_INSTRUCTIONS = (
+    f"Answer questions about the git repository at {REPO_PATH}, use that for repo_path"
+)
+
 
 async def _main(
     query: str, history: list[ChatMessage], session_state: dict[str, Any]
@@ -56,12 +68,6 @@ async def _main(
     # previous turns in the conversation
     session = get_or_create_agent_session(history, session_state)
 
-    # Get the absolute path to the current git repository, regardless of where
-    # the script is run from
-    repo_path = subprocess.check_output(
-        ["git", "rev-parse", "--show-toplevel"], text=True
-    ).strip()
-
     with (
         langfuse_client.start_as_current_observation(
             name="Git-Agent", as_type="agent", input=query
@@ -82,7 +88,7 @@ async def _main(
         ) as mcp_server:
             agent = agents.Agent(
                 name="Git Assistant",
-                instructions=f"Answer questions about the git repository at {repo_path}, use that for repo_path",
+                instructions=GIT_AGENT_INSTRUCTIONS,
                 mcp_servers=[mcp_server],
                 model=agents.OpenAIChatCompletionsModel(
                     model=client_manager.configs.default_planner_model,
@@ -94,13 +100,15 @@ async def _main(
                 agent, input=query, session=session
             )
             async for _item in result_stream.stream_events():
-                turn_messages += oai_agent_stream_to_gradio_messages(_item)
-                if len(turn_messages) > 0:
+                # Only re-send the history when the event added messages
+                new_messages = oai_agent_stream_to_gradio_messages(_item)
+                if new_messages:
+                    turn_messages += new_messages
                     yield turn_messages
 
         obs.update(output=result_stream.final_output)
 
-    pretty_print(turn_messages)
+    logger.debug("Turn messages: %s", turn_messages)
     yield turn_messages
 
     # Clear the turn messages after yielding to prepare for the next turn
@@ -2,15 +2,27 @@
 
 import argparse
 import asyncio
+import functools
 
 import agents
 import pydantic
-from aieng.agents import gather_with_progress, set_up_logging
+from aieng.agents import (
+    AsyncRateLimiter,
+    gather_with_progress,
+    rate_limited,
+    set_up_logging,
+)
 from aieng.agents.client_manager import AsyncClientManager
-from aieng.agents.langfuse import flush_langfuse, langfuse_client, setup_langfuse_tracer
+from aieng.agents.langfuse import (
+    flush_langfuse,
+    get_cached_dataset_items,
+    get_scored_item_ids,
+    langfuse_client,
+    setup_langfuse_tracer,
+)
 from dotenv import load_dotenv
 from langfuse._client.datasets import DatasetItemClient
-from rich.progress import track
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
 
 load_dotenv(verbose=True)
@@ -28,24 +40,12 @@ Do not make up information.
 Finally, write "|" and include a one-sentence summary of your answer.
 """
 
+# Name of the score uploaded for every evaluated dataset item
+SCORE_NAME = "is_answer_correct"
+
 EVALUATOR_INSTRUCTIONS = """\
 Evaluate whether the "Proposed Answer" to the given "Question" matches the "Ground Truth"."""
 
-EVALUATOR_TEMPLATE = """\
-# Question
-
-{question}
-
-# Ground Truth
-
-{ground_truth}
-
-# Proposed Answer
-
-{proposed_response}
-
-"""
-
 
 class LangFuseTracedResponse(pydantic.BaseModel):
     """Agent Response and LangFuse Trace info."""
@@ -63,7 +63,20 @@ class EvaluatorQuery(pydantic.BaseModel):
 
     def get_query(self) -> str:
         """Obtain query string to the evaluator agent."""
-        return EVALUATOR_TEMPLATE.format(**self.model_dump())
+        return f"""\
+# Question
+
+{self.question}
+
+# Ground Truth
+
+{self.ground_truth}
+
+# Proposed Answer
+
+{self.proposed_response}
+
+"""
 
 
 class EvaluatorResponse(pydantic.BaseModel):
@@ -95,27 +108,87 @@ async def run_agent_with_trace(
     )
 
 
-async def run_evaluator_agent(evaluator_query: EvaluatorQuery) -> EvaluatorResponse:
-    """Evaluate using evaluator agent."""
-    evaluator_agent = agents.Agent(
+# Answers shared between dataset items that ask the exact same question.
+# Values are futures so that concurrent duplicates wait for a single agent run.
+_answers_by_question: dict[str, "asyncio.Future[str | None]"] = {}
+
+
+async def run_agent_with_answer_reuse(
+    agent: agents.Agent, query: str
+) -> "LangFuseTracedResponse":
+    """Like run_agent_with_trace, but reuse the answer of an identical query.
+
+    Only non-None answers are reused; if the earlier run gave up, run again.
+    The returned trace_id is always that of the caller's own trace.
+    """
+    pending = _answers_by_question.get(query)
+    if pending is not None:
+        answer = await pending
+        if answer is not None:
+            return LangFuseTracedResponse(
+                answer=answer, trace_id=langfuse_client.get_current_trace_id()
+            )
+
+    future: "asyncio.Future[str | None]" = asyncio.get_running_loop().create_future()
+    _answers_by_question[query] = future
+    traced_response = None
+    try:
+        traced_response = await run_agent_with_trace(agent, query)
+    finally:
+        answer = traced_response.answer if traced_response is not None else None
+        future.set_result(answer)
+        if answer is None and _answers_by_question.get(query) is future:
+            del _answers_by_question[query]
+
+    return traced_response
+
+
+def _get_rate_limited_client(
+    client: AsyncOpenAI, limiter: AsyncRateLimiter
+) -> AsyncOpenAI:
+    """Copy of ``client`` that waits for ``limiter`` before every HTTP request.
+
+    Limiting at the HTTP layer paces each chat completion an agent run makes,
+    including SDK retries, rather than whole agent runs.
+    """
+
+    async def _wait_for_slot(_request: object) -> None:
+        await limiter.acquire()
+
+    return client.with_options(
+        http_client=DefaultAsyncHttpxClient(event_hooks={"request": [_wait_for_slot]})
+    )
+
+
+@functools.cache
+def _get_evaluator_agent() -> agents.Agent:
+    """Build the evaluator agent once; it holds no per-query state."""
+    return agents.Agent(
         name="Evaluator Agent",
         instructions=EVALUATOR_INSTRUCTIONS,
         output_type=EvaluatorResponse,
         model=agents.OpenAIChatCompletionsModel(
             model=client_manager.configs.default_planner_model,
-            openai_client=client_manager.openai_client,
+            openai_client=llm_client,
         ),
     )
 
-    result = await agents.Runner.run(evaluator_agent, input=evaluator_query.get_query())
+
+async def run_evaluator_agent(evaluator_query: EvaluatorQuery) -> EvaluatorResponse:
+    """Evaluate using evaluator agent."""
+    result = await agents.Runner.run(
+        _get_evaluator_agent(), input=evaluator_query.get_query()
+    )
     return result.final_output_as(EvaluatorResponse)
 
 
 async def run_and_evaluate(
     run_name: str, main_agent: agents.Agent, lf_dataset_item: "DatasetItemClient"
 ) -> "tuple[LangFuseTracedResponse, EvaluatorResponse | None]":
-    """Run main agent and evaluator agent on one dataset instance.
+    """Run main agent and evaluator agent on one dataset instance, then score it.
 
+    The score is uploaded as soon as the item is evaluated, so an interrupted
+    run keeps the scores of finished items and --resume can skip them.
     Returns None if main agent returned a None answer.
     """
     expected_output = lf_dataset_item.expected_output
@@ -123,14 +196,20 @@ async def run_and_evaluate(
 
     with lf_dataset_item.run(run_name=run_name) as root_span:
         root_span.update(input=lf_dataset_item.input["text"])
-        traced_response = await run_agent_with_trace(
+        run_agent = (
+            run_agent_with_answer_reuse
+            if args.reuse_duplicate_answers
+            else run_agent_with_trace
+        )
+        traced_response = await run_agent(
             main_agent, query=lf_dataset_item.input["text"]
         )
-        root_span.update(output=traced_response.answer)
+        answer = traced_response.answer
+        if answer is None:
+            # Agent gave up; nothing to record on the span or to evaluate.
+            return traced_response, None
 
-    answer = traced_response.answer
-    if answer is None:
-        return traced_response, None
+        root_span.update(output=answer)
 
     evaluator_response = await run_evaluator_agent(
         EvaluatorQuery(
@@ -140,6 +219,14 @@ async def run_and_evaluate(
         )
     )
 
+    # Link the trace to the dataset item for analysis
+    langfuse_client.create_score(
+        name=SCORE_NAME,
+        value=evaluator_response.is_answer_correct,
+        comment=evaluator_response.explanation,
+        trace_id=traced_response.trace_id,
+    )
+
     return traced_response, evaluator_response
 
 
@@ -150,33 +237,27 @@ async def _main() -> None:
         tools=[agents.function_tool(client_manager.knowledgebase.search_knowledgebase)],
         model=agents.OpenAIChatCompletionsModel(
             model=client_manager.configs.default_planner_model,
-            openai_client=client_manager.openai_client,
+            openai_client=llm_client,
         ),
     )
 
+    # Bound the number of dataset items in flight; each one makes several LLM,
+    # embedding and Weaviate calls.
+    semaphore = asyncio.Semaphore(args.max_concurrency)
     coros = [
-        run_and_evaluate(
-            run_name=args.run_name, main_agent=main_agent, lf_dataset_item=_item
+        rate_limited(
+            lambda _item=_item: run_and_evaluate(
+                run_name=args.run_name, main_agent=main_agent, lf_dataset_item=_item
+            ),
+            semaphore=semaphore,
         )
         for _item in lf_dataset_items
     ]
-    results = await gather_with_progress(
-        coros, description="Running agent and evaluating"
-    )
-
-    for _traced_response, _eval_output in track(
-        results, total=len(results), description="Uploading scores"
-    ):
-        # Link the trace to the dataset item for analysis
-        if _eval_output is not None:
-            langfuse_client.create_score(
-                name="is_answer_correct",
-                value=_eval_output.is_answer_correct,
-                comment=_eval_output.explanation,
-                trace_id=_traced_response.trace_id,
-            )
+    await gather_with_progress(coros, description="Running agent and evaluating")
 
     flush_langfuse()
+    if llm_client is not client_manager.openai_client:
+        await llm_client.close()
     await client_manager.close()
 
 
@@ -185,13 +266,51 @@ if __name__ == "__main__":
     parser.add_argument("--langfuse_dataset_name", required=True)
     parser.add_argument("--run_name", required=True)
     parser.add_argument("--limit", type=int)
+    parser.add_argument("--max_concurrency", type=int, default=8)
+    parser.add_argument(
+        "--requests_per_minute",
+        type=int,
+        help="Cap on LLM API requests per minute, including retries, to stay "
+        "under provider limits. Embedding requests are not counted.",
+    )
+    parser.add_argument(
+        "--reuse_duplicate_answers",
+        action="store_true",
+        help="Run the agent once per distinct question and reuse its answer.",
+    )
+    parser.add_argument(
+        "--refresh_dataset_cache",
+        action="store_true",
+        help="Download the dataset again instead of using the local copy, "
+        "e.g. after existing items were edited.",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip dataset items that were already scored under --run_name.",
+    )
     args = parser.parse_args()
 
     setup_langfuse_tracer()
 
     client_manager = AsyncClientManager()
+    llm_client = client_manager.openai_client
+    if args.requests_per_minute:
+        llm_client = _get_rate_limited_client(
+            llm_client, AsyncRateLimiter(args.requests_per_minute)
+        )
 
-    lf_dataset_items = langfuse_client.get_dataset(args.langfuse_dataset_name).items
+    lf_dataset_items = get_cached_dataset_items(
+        args.langfuse_dataset_name, refresh=args.refresh_dataset_cache
+    )
+    if args.resume:
+        completed_ids = get_scored_item_ids(
+            args.langfuse_dataset_name, args.run_name, SCORE_NAME
+        )
+        lf_dataset_items = [
+            _item for _item in lf_dataset_items if _item.id not in completed_ids
+        ]
+        print(f"Resuming {args.run_name}: {len(completed_ids)} items already scored.")
     if args.limit is not None:
         lf_dataset_items = lf_dataset_items[: args.limit]
 
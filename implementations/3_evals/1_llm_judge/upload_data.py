@@ -5,6 +5,7 @@ langfuse.com/docs/integrations/openaiagentssdk/example-evaluating-openai-agents
 """
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 
 from aieng.agents import Configs
 from aieng.agents.data import get_dataset, get_dataset_url_hash
@@ -20,6 +21,7 @@ if __name__ == "__main__":
     parser.add_argument("--source_dataset", required=True)
     parser.add_argument("--langfuse_dataset_name", required=True)
     parser.add_argument("--limit", type=int)
+    parser.add_argument("--max_concurrency", type=int, default=8)
     args = parser.parse_args()
 
     configs = Configs()
@@ -50,13 +52,22 @@ if __name__ == "__main__":
 
     df = get_dataset(args.source_dataset, limit=args.limit)
 
-    for idx, row in track(
-        df.iterrows(), total=len(df), description="Uploading to Langfuse"
-    ):
+    def _upload_row(row: tuple[int, str, str]) -> None:
+        idx, question, expected_answer = row
         langfuse_client.create_dataset_item(
             dataset_name=args.langfuse_dataset_name,
-            input={"text": row["question"]},
-            expected_output={"text": row["expected_answer"]},
+            input={"text": question},
+            expected_output={"text": expected_answer},
             # unique id to enable upsert without creating duplicates
             id=f"{dataset_url_hash}-{idx:05}",
         )
+
+    # Each upload is a blocking HTTP request; overlap them in a thread pool.
+    rows = df[["question", "expected_answer"]].itertuples(index=True, name=None)
+    with ThreadPoolExecutor(max_workers=args.max_concurrency) as executor:
+        for _ in track(
+            executor.map(_upload_row, rows),
+            total=len(df),
+            description="Uploading to Langfuse",
+        ):
+            pass
@@ -19,7 +19,11 @@ import pandas as pd
 import pydantic
 from aieng.agents import Configs, gather_with_progress
 from aieng.agents.data import create_batches
-from aieng.agents.langfuse import flush_langfuse, langfuse_client
+from aieng.agents.langfuse import (
+    flush_langfuse,
+    get_cached_dataset_items,
+    langfuse_client,
+)
 from openai import AsyncOpenAI
 from rich.progress import track
 
@@ -75,7 +79,8 @@ def _avg_cosine_similarity(matrix: np.ndarray) -> np.ndarray:
 
     (MIT)
     """
-    row_norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    # Row-wise sqrt(x . x); avoids the dispatch overhead of np.linalg.norm
+    row_norms = np.sqrt(np.einsum("ij,ij->i", matrix, matrix))[:, np.newaxis]
     row_norms[row_norms == 0] = 1e-10  # avoid division by zero
 
     normalized_matrix = matrix / row_norms  # shape: (n, m)
@@ -89,10 +94,18 @@ if __name__ == "__main__":
     parser.add_argument("--run_name", default="cosine_similarity")
     parser.add_argument("--limit", type=int)
     parser.add_argument("--embed_batch_size", type=int, default=18)
+    parser.add_argument(
+        "--refresh_dataset_cache",
+        action="store_true",
+        help="Download the dataset again instead of using the local copy, "
+        "e.g. after existing items were edited.",
+    )
     args = parser.parse_args()
     assert args.embed_batch_size > 0, "args.embed_batch_size must be at least 1."
 
-    lf_dataset_items = langfuse_client.get_dataset(args.langfuse_dataset_name).items
+    lf_dataset_items = get_cached_dataset_items(
+        args.langfuse_dataset_name, refresh=args.refresh_dataset_cache
+    )
     limit = (
         min(len(lf_dataset_items), args.limit) if args.limit else len(lf_dataset_items)
     )
@@ -132,7 +145,7 @@ if __name__ == "__main__":
 
     # Compute per-row cosine similarity offsets
     embeddings = [_result.embedding for _result in embed_results]
-    embeddings_np = np.asarray(embeddings)  # (N, L)
+    embeddings_np = np.asarray(embeddings, dtype=np.float32)  # (N, L)
     cosine_similarities = _avg_cosine_similarity(embeddings_np)  # (N,)
     mean_similarity = np.mean(cosine_similarities).item()
     assert cosine_similarities.shape == (len(embeddings),), cosine_similarities.shape
@@ -143,7 +156,8 @@ if __name__ == "__main__":
 
     # Annotate dataset rows in LangFuse
     for _similarity, _trace_id in zip(
-        track(cosine_similarities.flatten(), description="Uploading scores..."),
+        # tolist() gives Python floats; np.float32 is not JSON serializable
+        track(cosine_similarities.tolist(), description="Uploading scores..."),
         [_result.langfuse_trace_id for _result in embed_results],
     ):
         langfuse_client.create_score(
@@ -5,20 +5,44 @@ Usage:
 uv run \
 --env-file .env \
 gradio implementations/3_evals/2_synthetic_data/gradio_visualize_diversity.py
+
+Embeddings are cached under ~/.cache/agent-bootcamp/embeddings, one file per
+dataset and row count; only the most recently used files are kept.
 """
 
+import hashlib
+import logging
+import os
+import tempfile
+from pathlib import Path
 from typing import List
 
 import gradio as gr
 import numpy as np
 import plotly.express as px
-from aieng.agents import Configs, gather_with_progress
+from aieng.agents import Configs, gather_with_progress, register_async_cleanup
 from aieng.agents.data import create_batches
-from aieng.agents.langfuse import langfuse_client
+from aieng.agents.langfuse import get_cached_dataset_items
 from openai import AsyncOpenAI
 from plotly.graph_objs import Figure
-from sklearn.decomposition import PCA
-from sklearn.manifold import TSNE
+
+
+if gr.NO_RELOAD:
+    # Create the embedding client once and reuse its connection pool across
+    # requests, instead of opening (and never closing) a new one per click.
+    configs = Configs()
+    embedding_client = AsyncOpenAI(
+        api_key=configs.embedding_api_key,
+        base_url=configs.embedding_base_url,
+        max_retries=5,
+    )
+    register_async_cleanup(embedding_client)
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_CACHE_DIR = Path.home() / ".cache" / "agent-bootcamp" / "embeddings"
+# Each distinct "rows to plot" value writes its own file, so cap how many stay
+EMBEDDING_CACHE_MAX_FILES = 32
 
 
 def reduce_dimensions(
@@ -36,13 +60,18 @@ def reduce_dimensions(
     -------
         np.ndarray: Reduced 2D embeddings of shape (n_samples, 2).
     """
+    # sklearn (and scipy under it) is slow to import; load only the reducer in use.
     if method == "tsne":
+        from sklearn.manifold import TSNE  # noqa: PLC0415
+
         reducer = TSNE(
             n_components=n_components,
             perplexity=min(embeddings.shape[0] - 1, 30),
             random_state=42,
         )
     elif method == "pca":
+        from sklearn.decomposition import PCA  # noqa: PLC0415
+
         reducer = PCA(n_components=n_components)
     else:
         raise ValueError("Method must be 'tsne' or 'pca'")
@@ -72,53 +101,103 @@ def plot_embeddings_2d(
     return fig
 
 
+def _embedding_cache_path(model_name: str, texts: List[str]) -> Path:
+    """Cache file for the embeddings of `texts`, keyed on model and exact inputs."""
+    fingerprint = hashlib.sha256(model_name.encode())
+    for _text in texts:
+        fingerprint.update(b"\x00" + _text.encode())
+    return EMBEDDING_CACHE_DIR / f"{fingerprint.hexdigest()}.npy"
+
+
+def _load_embeddings(path: Path, num_texts: int) -> np.ndarray | None:
+    """Return cached embeddings, or None if missing or unreadable."""
+    if not path.exists():
+        return None
+    try:
+        embeddings = np.load(path)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable embedding cache {path}: {e}")
+        return None
+    if embeddings.ndim != 2 or embeddings.shape[0] != num_texts:
+        logger.warning(f"Ignoring embedding cache {path} of shape {embeddings.shape}")
+        return None
+
+    # Mark as recently used so pruning keeps it
+    path.touch()
+    return embeddings
+
+
+def _prune_embedding_cache(cache_dir: Path, keep: int) -> None:
+    """Delete all but the ``keep`` most recently used embedding files."""
+    cache_files = sorted(
+        cache_dir.glob("*.npy"), key=lambda _path: _path.stat().st_mtime, reverse=True
+    )
+    for stale_path in cache_files[keep:]:
+        stale_path.unlink(missing_ok=True)
+
+
+def _save_embeddings(path: Path, embeddings: np.ndarray) -> None:
+    """Write embeddings via a temp file so readers never see a partial array."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".npy.tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, embeddings)
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+    _prune_embedding_cache(path.parent, keep=EMBEDDING_CACHE_MAX_FILES)
+
+
 async def get_projection_plot(
     dataset_name: str,
     projection_method: str,
     limit: int | None = None,
+    refresh_dataset_cache: bool = False,
     embedding_batch_size: int = 16,
 ) -> Figure:
     """Obtain projection plot for the given dataset up to `limit` items."""
-    lf_dataset_items = langfuse_client.get_dataset(dataset_name.strip()).items
-
-    # Generate embeddings
-    configs = Configs()
-    embedding_client = AsyncOpenAI(
-        api_key=configs.embedding_api_key,
-        base_url=configs.embedding_base_url,
-        max_retries=5,
+    lf_dataset_items = get_cached_dataset_items(
+        dataset_name.strip(), refresh=refresh_dataset_cache
     )
 
     texts = [_item.input["text"] for _item in lf_dataset_items]
-    text_batches = create_batches(
-        texts,
-        batch_size=embedding_batch_size,
-        limit=int(limit) if limit else None,
-        keep_trailing=True,
-    )
-    embed_coros = [
-        embedding_client.embeddings.create(
-            input=_batch, model=configs.embedding_model_name
+    num_texts = min(int(limit), len(texts)) if limit else len(texts)
+    texts = texts[:num_texts]
+
+    # Generate embeddings, reusing ones computed earlier for the same texts
+    cache_path = _embedding_cache_path(configs.embedding_model_name, texts)
+    embeddings_np = _load_embeddings(cache_path, num_texts)
+    if embeddings_np is None:
+        text_batches = create_batches(
+            texts, batch_size=embedding_batch_size, keep_trailing=True
         )
-        for _batch in text_batches
-    ]
-    batched_embed_results = await gather_with_progress(
-        embed_coros, description=f"Generating {len(texts)} embeddings"
-    )
-    embeddings = [
-        _data.embedding for _result in batched_embed_results for _data in _result.data
-    ]  # unpacked
-    embeddings_np = np.asarray(embeddings)
+        embed_coros = [
+            embedding_client.embeddings.create(
+                input=_batch, model=configs.embedding_model_name
+            )
+            for _batch in text_batches
+        ]
+        batched_embed_results = await gather_with_progress(
+            embed_coros, description=f"Generating {len(texts)} embeddings"
+        )
+        embeddings = [
+            _data.embedding
+            for _result in batched_embed_results
+            for _data in _result.data
+        ]  # unpacked
+        embeddings_np = np.asarray(embeddings, dtype=np.float32)
+        _save_embeddings(cache_path, embeddings_np)
 
     # Reduce dimensions
-    num_texts = min(int(limit), len(texts)) if limit else len(texts)
     assert embeddings_np.shape[0] == num_texts, (embeddings_np.shape, num_texts)
     embeddings_reduced = reduce_dimensions(embeddings_np, method=projection_method)
 
     # Create plot
     return plot_embeddings_2d(
         reduced_embeddings=embeddings_reduced,
-        texts=texts[:num_texts],
+        texts=texts,
         dataset_title=dataset_name,
     )
 
@@ -129,6 +208,10 @@ demo = gr.Interface(
         gr.Textbox(label="Dataset name"),
         gr.Radio(["tsne", "pca"], label="Dimensionality Reduction Method"),
         gr.Number(value=18, label="Number of rows to plot", minimum=1),
+        gr.Checkbox(
+            label="Refresh dataset cache",
+            info="Download the dataset again, e.g. after existing items were edited.",
+        ),
     ],
     outputs=gr.Plot(label="2D Embedding Plot"),
     title="3.2 Text Embedding Visualizer",
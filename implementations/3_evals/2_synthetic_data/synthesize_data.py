@@ -9,7 +9,9 @@ Overview:
 
 import argparse
 import asyncio
+import json
 import random
+from concurrent.futures import ThreadPoolExecutor
 
 import agents
 import pydantic
@@ -67,6 +69,10 @@ class _SyntheticTestCases(pydantic.RootModel):
     root: list[_SyntheticTestCase]
 
 
+# Rendered once at import; embedded in the generator agent's instructions.
+_SCHEMA_JSON = json.dumps(_SyntheticTestCases.model_json_schema())
+
+
 async def generate_synthetic_test_cases(
     test_case_generator_agent: agents.Agent,
     news_event: "NewsEvent",
@@ -98,7 +104,7 @@ async def generate_synthetic_test_cases(
         raw_response = await agents.Runner.run(
             test_case_generator_agent,
             input="Generate test question-answer pairs based on this news event: \n"
-            + news_event.model_dump_json(indent=2),
+            + news_event.model_dump_json(),
         )
         structured_response = await agents.Runner.run(
             structured_output_agent,
@@ -114,6 +120,7 @@ if __name__ == "__main__":
     parser.add_argument("--langfuse_dataset_name", required=True)
     parser.add_argument("--limit", type=int, default=18)
     parser.add_argument("--max_concurrency", type=int, default=3)
+    parser.add_argument("--upload_concurrency", type=int, default=8)
     args = parser.parse_args()
 
     setup_langfuse_tracer()
@@ -143,11 +150,7 @@ if __name__ == "__main__":
             raise exc from e
 
     df = get_dataset(args.source_dataset, limit=90)
-    rows_news_only = [row.to_dict() for _, row in df.iterrows()]
-    rows_filtered = [
-        {k: v for k, v in row.items() if k in ("question", "expected_answer")}
-        for row in rows_news_only
-    ]
+    rows_filtered = df[["question", "expected_answer"]].to_dict(orient="records")
 
     example_questions = generator.choices(rows_filtered, k=5)
     example_questions_str = pretty_print(example_questions)
@@ -155,7 +158,7 @@ if __name__ == "__main__":
         name="Test Case Generator Agent",
         instructions=SYSTEM_MESSAGE.format(
             example_questions=example_questions_str,
-            json_schema=_SyntheticTestCases.model_json_schema(),
+            json_schema=_SCHEMA_JSON,
         ),
         # HINT: replace this tool with your own knowledge base search tool.
         tools=[agents.function_tool(client_manager.knowledgebase.search_knowledgebase)],
@@ -193,10 +196,8 @@ if __name__ == "__main__":
 
     all_examples = [_test_case for _test_cases in results for _test_case in _test_cases]
 
-    # Upload to Langfuse
-    for idx, _test_case in enumerate(
-        track(all_examples, description="Uploading to Langfuse")
-    ):
+    def _upload_test_case(indexed_test_case: tuple[int, _SyntheticTestCase]) -> None:
+        idx, _test_case = indexed_test_case
         langfuse_client.create_dataset_item(
             dataset_name=args.langfuse_dataset_name,
             input={"text": _test_case.question},
@@ -205,3 +206,12 @@ if __name__ == "__main__":
             # unique id to enable upsert without creating duplicates
             id=f"{dataset_name_hash}-{idx:05}",
         )
+
+    # Upload to Langfuse; each upload is a blocking HTTP request, so overlap them.
+    with ThreadPoolExecutor(max_workers=args.upload_concurrency) as executor:
+        for _ in track(
+            executor.map(_upload_test_case, enumerate(all_examples)),
+            total=len(all_examples),
+            description="Uploading to Langfuse",
+        ):
+            pass
@@ -19,7 +19,9 @@ uv run --env-file .env implementations/3_evals/2_synthetic_data/synthesize_data_
 
 import argparse
 import asyncio
+import json
 import random
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import agents
@@ -72,6 +74,10 @@ class _SyntheticTestCase(pydantic.BaseModel):
     citations: list[_Citation]
 
 
+# Rendered once at import; embedded in the generator agent's instructions.
+_SCHEMA_JSON = json.dumps(_SyntheticTestCase.model_json_schema())
+
+
 async def generate_synthetic_test_cases(
     test_case_generator_agent: agents.Agent,
 ) -> list[_SyntheticTestCase] | None:
@@ -118,6 +124,7 @@ if __name__ == "__main__":
     parser.add_argument("--langfuse_dataset_name", required=True)
     parser.add_argument("--limit", type=int, default=18)
     parser.add_argument("--max_concurrency", type=int, default=3)
+    parser.add_argument("--upload_concurrency", type=int, default=8)
     args = parser.parse_args()
 
     client_manager = AsyncClientManager()
@@ -159,7 +166,7 @@ if __name__ == "__main__":
         name="Test Case Generator Agent",
         instructions=SYSTEM_MESSAGE.format(
             example_questions=example_questions_str,
-            json_schema=_SyntheticTestCase.model_json_schema(),
+            json_schema=_SCHEMA_JSON,
         ),
         tools=[agents.function_tool(code_interpreter.run_code)],
         model=agents.OpenAIChatCompletionsModel(
@@ -208,10 +215,8 @@ if __name__ == "__main__":
         for _test_case in _test_cases
     ]
 
-    # Upload to Langfuse
-    for idx, _test_case in enumerate(
-        track(all_examples, description="Uploading to Langfuse")
-    ):
+    def _upload_test_case(indexed_test_case: tuple[int, _SyntheticTestCase]) -> None:
+        idx, _test_case = indexed_test_case
         langfuse_client.create_dataset_item(
             dataset_name=args.langfuse_dataset_name,
             input={"text": _test_case.question},
@@ -220,3 +225,12 @@ if __name__ == "__main__":
             # unique id to enable upsert without creating duplicates
             id=f"{dataset_name_hash}-{idx:05}",
         )
+
+    # Upload to Langfuse; each upload is a blocking HTTP request, so overlap them.
+    with ThreadPoolExecutor(max_workers=args.upload_concurrency) as executor:
+        for _ in track(
+            executor.map(_upload_test_case, enumerate(all_examples)),
+            total=len(all_examples),
+            description="Uploading to Langfuse",
+        ):
+            pass
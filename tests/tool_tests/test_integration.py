@@ -40,9 +40,10 @@ async def weaviate_kb(
     await async_client.close()
 
 
-def test_vectorizer(weaviate_kb: AsyncWeaviateKnowledgeBase) -> None:
+@pytest.mark.asyncio
+async def test_vectorizer(weaviate_kb: AsyncWeaviateKnowledgeBase) -> None:
     """Test vectorizer integration."""
-    vector = weaviate_kb._vectorize("What is Toronto known for?")
+    vector = await weaviate_kb._vectorize("What is Toronto known for?")
     assert vector is not None
     assert len(vector) > 0
     print(f"Vector ({len(vector)} dimensions): {vector[:10]}...")